@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+Compiled helpers for the array work done while plotting. Numba is optional:
+when it is not installed the same functions fall back to plain NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _pair_finite_numpy(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    finite = np.isfinite(x) & np.isfinite(y)
+    return (
+        np.ascontiguousarray(x[finite], dtype=np.float32),
+        np.ascontiguousarray(y[finite], dtype=np.float32),
+    )
+
+
+if njit is not None:
+
+    # ! no fastmath here, it lets the compiler assume values are always finite
+    @njit(cache=True)
+    def _pair_finite_numba(x, y):
+        n = 0
+        for i in range(x.shape[0]):
+            if np.isfinite(x[i]) and np.isfinite(y[i]):
+                n += 1
+        x_out = np.empty(n, dtype=np.float32)
+        y_out = np.empty(n, dtype=np.float32)
+        j = 0
+        for i in range(x.shape[0]):
+            if np.isfinite(x[i]) and np.isfinite(y[i]):
+                x_out[j] = x[i]
+                y_out[j] = y[i]
+                j += 1
+        return x_out, y_out
+
+
+def pair_finite(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Keep only the (x, y) pairs where both values are finite
+
+    Parameters
+    ----------
+    x : np.ndarray
+        1-D array of values for the first replicate
+    y : np.ndarray
+        1-D array of values for the second replicate, same length as x
+
+    Returns
+    -------
+    x_finite, y_finite : tuple[np.ndarray, np.ndarray]
+        Contiguous float32 arrays with the non-finite pairs removed
+    """
+    x = np.ascontiguousarray(x).ravel()
+    y = np.ascontiguousarray(y).ravel()
+    if njit is None:
+        return _pair_finite_numpy(x, y)
+    return _pair_finite_numba(x, y)
+
+
+def _pack_rows(mask: np.ndarray) -> np.ndarray:
+    """Bit-pack each row of a 2-D bool array into uint64 lanes"""
+    packed = np.packbits(mask, axis=-1, bitorder="little")
+    # pad each row out to a whole number of 8-byte lanes
+    pad = -packed.shape[-1] % 8
+    if pad:
+        packed = np.pad(packed, [(0, 0)] * (packed.ndim - 1) + [(0, pad)])
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+
+def _positions_with_signal_numpy(
+    sensitive: np.ndarray, resistant: np.ndarray, stop_col: int
+) -> np.ndarray:
+    # * OR the masks 64 columns at a time, with the stop column cleared
+    keep = np.ones(sensitive.shape[1], dtype=np.bool_)
+    keep[stop_col] = False
+    combined = (_pack_rows(sensitive) | _pack_rows(resistant)) & _pack_rows(keep)
+    return (combined != 0).any(axis=1)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _positions_with_signal_numba(sensitive, resistant, stop_col):
+        rows, cols = sensitive.shape
+        out = np.zeros(rows, dtype=np.bool_)
+        for i in range(rows):
+            for j in range(cols):
+                if j != stop_col and (sensitive[i, j] or resistant[i, j]):
+                    out[i] = True
+                    break
+        return out
+
+
+def positions_with_signal(
+    sensitive: np.ndarray, resistant: np.ndarray, stop_col: int
+) -> np.ndarray:
+    """
+    Find the rows (positions) with at least one significant mutation, ignoring
+    the stop-mutation column
+
+    Parameters
+    ----------
+    sensitive : np.ndarray
+        2-D bool array of significantly sensitive mutations
+    resistant : np.ndarray
+        2-D bool array of significantly resistant mutations, same shape as sensitive
+    stop_col : int
+        Column index of stop mutations to exclude
+
+    Returns
+    -------
+    np.ndarray
+        1-D bool array, True for positions with a significant mutation
+    """
+    sensitive = np.ascontiguousarray(sensitive, dtype=np.bool_)
+    resistant = np.ascontiguousarray(resistant, dtype=np.bool_)
+    if njit is None:
+        return _positions_with_signal_numpy(sensitive, resistant, stop_col)
+    return _positions_with_signal_numba(sensitive, resistant, stop_col)
@@ -31,7 +31,7 @@ def get_gaussian_model(df_x: pd.DataFrame, df_y: pd.DataFrame) -> GaussianMixtur
     x_syn = df_x["∅"]
     y_syn = df_y["∅"]
     # * build numpy matrix for gaussian model fitting
-    X_syn_train = np.column_stack((x_syn.values.flatten(), y_syn.values.flatten()))
+    X_syn_train = np.column_stack((x_syn.to_numpy(), y_syn.to_numpy()))
     # filter NaN in pairs
     X_syn_train = X_syn_train[~np.isnan(X_syn_train).any(axis=1)]
 
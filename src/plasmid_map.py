@@ -5,6 +5,7 @@ This script creates a class that holds relevant information about the gene
 file provided.
 """
 from dataclasses import dataclass
+from functools import cached_property
 
 import numpy as np
 import pandas as pd
@@ -95,10 +96,11 @@ class Gene:
             return self.cds.extract(self.gbk_record.seq)
         return None
 
-    @property
+    @cached_property
     def cds_translation(self) -> SeqIO.SeqRecord:
         """
-        Translated protein sequence of gene coding region
+        Translated protein sequence of gene coding region (cached after the
+        first lookup, since it requires re-reading the GenBank file)
 
         Returns
         -------
@@ -108,6 +110,21 @@ class Gene:
             return self.cds_seq.translate()
         return None
 
+    @cached_property
+    def cds_translation_array(self) -> np.ndarray:
+        """
+        Translated protein sequence as an array of single residues, for
+        looking up many positions at once (cached after the first lookup)
+
+        Returns
+        -------
+        np.ndarray
+        """
+        if self.cds_translation is None:
+            return None
+        residues = str(self.cds_translation).encode("ascii")
+        return np.frombuffer(residues, dtype="S1").astype("U1")
+
     @property
     def codon_starts(self) -> pd.Series:
         """
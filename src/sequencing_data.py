@@ -13,6 +13,8 @@ import copy
 import csv
 import glob
 import re
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
 from Bio.Data import IUPACData
@@ -96,6 +98,59 @@ def heatmap_table(gene: Gene) -> pd.DataFrame:
     return df
 
 
+def _read_only_table(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy a single-dtype table on top of a read-only array, so that a cached
+    table can be handed out to every caller without copying it again:
+    in-place edits raise a ValueError instead of changing the cache
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Table to copy
+
+    Returns
+    -------
+    pd.DataFrame
+        Read-only copy of df
+    """
+    values = df.to_numpy(copy=True)
+    values.flags.writeable = False
+    return pd.DataFrame(values, index=df.index, columns=df.columns, copy=False)
+
+
+@lru_cache(maxsize=None)
+def _wild_type_table(translation: str) -> pd.DataFrame:
+    """
+    Builds the wild-type mask for a translated protein sequence. Cached on the
+    sequence so that the mask is only built once per gene.
+
+    Parameters
+    ----------
+    translation : str
+        Translated protein sequence
+
+    Returns
+    -------
+    df_wt : pd.DataFrame
+        DataFrame with wild-type cells marked as True
+    """
+    columns = list(IUPACData.protein_letters + "*∅")
+    column_index = {residue: i for i, residue in enumerate(columns)}
+    # * one fancy-indexing assignment instead of a .loc call per position,
+    # * residues outside the table (e.g. X from an ambiguous codon) stay unmarked
+    residue_cols = np.fromiter(
+        (column_index.get(residue, -1) for residue in translation),
+        dtype=np.intp,
+        count=len(translation),
+    )
+    marked = residue_cols >= 0
+    wt = np.zeros((len(translation), len(columns)), dtype=bool)
+    wt[np.flatnonzero(marked), residue_cols[marked]] = True
+    df_wt = pd.DataFrame(wt, index=np.arange(len(translation)), columns=columns)
+    return _read_only_table(df_wt)
+
+
 def heatmap_masks(gene: Gene) -> pd.DataFrame:
     """
     Returns a bool DataFrame with wild-type cells marked as True for heatmap
@@ -109,14 +164,32 @@ def heatmap_masks(gene: Gene) -> pd.DataFrame:
     Returns
     -------
     df_wt : pd.DataFrame
-        DataFrame to use for marking wild-type cells on heatmaps
+        DataFrame to use for marking wild-type cells on heatmaps, shared
+        between calls and read-only (copy it before modifying)
     """
-    df_wt = heatmap_table(gene)
-    for position, residue in enumerate(gene.cds_translation):
-        df_wt.loc[position, residue] = True
+    df_wt = _wild_type_table(str(gene.cds_translation))
     return df_wt
 
 
+# * filter_fitness_read_noise results keyed on (id(counts_dict), id(fitness_dict), read_threshold),
+# * entries keep a reference to both dicts so that their ids can't be reused
+# * least recently used entries are dropped past _FILTER_CACHE_SIZE
+_FILTER_CACHE_SIZE = 8
+_filtered_cache = OrderedDict()
+
+
+def clear_filter_cache() -> None:
+    """
+    Empty the cache used by `filter_fitness_read_noise`. Needed if DataFrames
+    inside a counts or fitness dictionary are modified in place.
+
+    Returns
+    -------
+    None
+    """
+    _filtered_cache.clear()
+
+
 def filter_fitness_read_noise(
     counts_dict: dict,
     fitness_dict: dict,
@@ -124,7 +197,10 @@ def filter_fitness_read_noise(
 ) -> dict:
     """
     Takes DataFrames for treated sample and returns a new DataFrame with cells
-    with untreated counts under the minimum read threshold filtered out
+    with untreated counts under the minimum read threshold filtered out.
+    Results are cached for each combination of counts_dict, fitness_dict, and
+    read_threshold (see `clear_filter_cache`). The tables are shared between
+    calls and read-only, copy them before modifying.
 
     Parameters
     ----------
@@ -140,16 +216,27 @@ def filter_fitness_read_noise(
     df_treated_filtered : dict
         Fitness tables with insufficient counts filtered out
     """
+    key = (id(counts_dict), id(fitness_dict), read_threshold)
+    if key in _filtered_cache:
+        _filtered_cache.move_to_end(key)
+        return dict(_filtered_cache[key][2])
+
     dfs_filtered = {}
     for sample in sorted(fitness_dict):
         untreated = match_treated_untreated(sample)
         df_counts_untreated = counts_dict[untreated]
         df_counts_sample = counts_dict[sample]
         df_fitness_sample = fitness_dict[sample]
-        dfs_filtered[sample] = df_fitness_sample.where(
-            df_counts_sample.ge(read_threshold) & df_counts_untreated.ge(read_threshold)
+        dfs_filtered[sample] = _read_only_table(
+            df_fitness_sample.where(
+                df_counts_sample.ge(read_threshold)
+                & df_counts_untreated.ge(read_threshold)
+            )
         )
-    return dfs_filtered
+    _filtered_cache[key] = (counts_dict, fitness_dict, dfs_filtered)
+    if len(_filtered_cache) > _FILTER_CACHE_SIZE:
+        _filtered_cache.popitem(last=False)
+    return dict(dfs_filtered)
 
 
 class SequencingData:
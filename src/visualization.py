@@ -2,17 +2,46 @@
 """
 Suite of functions written for generating figures associated with deep
 mutagenesis library selection experiments
+
+Figures are only returned for saving, so outside of interactive sessions the
+non-interactive Agg backend is used. Set the MPLBACKEND environment variable
+(e.g. MPLBACKEND=QtAgg) to use a different backend.
 """
 
+import copy
+import os
+import sys
+import warnings
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
 import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+
+
+def _interactive() -> bool:
+    """Whether this is running in an interactive shell or IPython/Jupyter"""
+    return hasattr(sys, "ps1") or bool(sys.flags.interactive) or "IPython" in sys.modules
+
+
+# ! only switch when nothing else has chosen a backend (env variable or pyplot)
+if (
+    "MPLBACKEND" not in os.environ
+    and "matplotlib.pyplot" not in sys.modules
+    and not _interactive()
+):
+    matplotlib.use("Agg")
+
+# pylint: disable=wrong-import-position
+import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.collections import PolyCollection
+from matplotlib.font_manager import FontProperties
 from matplotlib.offsetbox import AnchoredText
-from matplotlib.patches import Rectangle, Ellipse
-from scipy.stats import norm
+from matplotlib.patches import Ellipse
 
+from _kernels import pair_finite, positions_with_signal
 from plasmid_map import Gene
 from sequencing_data import (
     SequencingData,
@@ -24,6 +53,8 @@ from sequencing_data import (
 
 from fitness_analysis import gaussian_significance
 
+# pylint: enable=wrong-import-position
+
 
 def respine(ax: matplotlib.axes) -> None:
     """
@@ -44,6 +75,161 @@ def respine(ax: matplotlib.axes) -> None:
         spine.set_lw(0.4)
 
 
+def _as_f32(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast values to float32 for plotting, fitness values don't need double
+    precision for display
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame with numeric values
+
+    Returns
+    -------
+    pd.DataFrame
+        float32 DataFrame (no copy if already float32)
+    """
+    return df.astype(np.float32, copy=False)
+
+
+def _contiguous(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rebuild a DataFrame on top of a C-contiguous float32 array so that plotting
+    reads the values in row order
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame with numeric values
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with the same labels and C-contiguous float32 values
+    """
+    values = np.ascontiguousarray(_as_f32(df).to_numpy())
+    return pd.DataFrame(values, index=df.index, columns=df.columns)
+
+
+# * marker edge width seaborn's scatterplot draws s=5 markers with (0.08 * sqrt(s)),
+# * the lw passed to sns.scatterplot was never applied
+_SCATTER_EDGE_LW = 0.08 * np.sqrt(5)
+
+
+def _cell_patches(xs: np.ndarray, ys: np.ndarray, **kwargs) -> PolyCollection:
+    """
+    Build a single collection of unit squares for marking heatmap cells, which
+    is much cheaper to create and draw than one Rectangle patch per cell
+
+    Parameters
+    ----------
+    xs : np.ndarray
+        x-coordinates of the lower-left corner of each cell
+    ys : np.ndarray
+        y-coordinates of the lower-left corner of each cell
+    **kwargs
+        Passed on to PolyCollection (e.g. fc, ec, lw)
+
+    Returns
+    -------
+    PolyCollection
+        Collection of squares with shape (N, 4, 2) vertices
+    """
+    corners = np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    verts = np.column_stack((xs, ys))[:, np.newaxis, :] + corners
+    return PolyCollection(verts, **kwargs)
+
+
+# * set to True to have the *_draw functions clear and redraw the Figure from
+# * their previous call (same figsize/dpi/layout) instead of creating a new one
+REUSE_FIGURES = False
+_figure_cache = {}
+
+
+def _subplots(
+    name: str,
+    nrows: int = 1,
+    ncols: int = 1,
+    figsize: tuple[float, float] = None,
+    dpi: float = None,
+    layout: str = None,
+    **kwargs,
+) -> tuple[matplotlib.figure.Figure, np.ndarray]:
+    """
+    Same as plt.subplots, but when REUSE_FIGURES is set the Figure previously
+    made for this name and figure settings is cleared and given new Axes,
+    skipping the cost of setting up a new high-dpi Figure
+
+    Parameters
+    ----------
+    name : str
+        Name of the drawing function, so that figures from different
+        functions are never shared
+    nrows : int, optional
+        Number of subplot rows, by default 1
+    ncols : int, optional
+        Number of subplot columns, by default 1
+    figsize : tuple[float, float], optional
+        Figure size in inches, by default None
+    dpi : float, optional
+        Figure resolution, by default None
+    layout : str, optional
+        Layout engine of the figure, by default None
+    **kwargs
+        Passed on to Figure.subplots (e.g. sharex, sharey, gridspec_kw)
+
+    Returns
+    -------
+    fig, axs : tuple[matplotlib.figure.Figure, np.ndarray]
+        Figure and Axes, as returned by plt.subplots
+    """
+    if not REUSE_FIGURES:
+        return plt.subplots(
+            nrows, ncols, figsize=figsize, dpi=dpi, layout=layout, **kwargs
+        )
+    key = (name, tuple(figsize) if figsize is not None else None, dpi, layout)
+    fig = _figure_cache.get(key)
+    # * the figure may have been closed since it was last drawn
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig = plt.figure(figsize=figsize, dpi=dpi, layout=layout)
+        _figure_cache[key] = fig
+    else:
+        fig.clear()
+    axs = fig.subplots(nrows, ncols, **kwargs)
+    return fig, axs
+
+
+MutationCategories = namedtuple("MutationCategories", ["missense", "syn", "stop"])
+
+
+def split_categories(df: pd.DataFrame) -> MutationCategories:
+    """
+    Split a fitness table into flat arrays of missense, synonymous (∅) and stop
+    (*) mutation values
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Fitness table with residue columns
+
+    Returns
+    -------
+    MutationCategories
+        Named tuple of C-contiguous float32 arrays (missense, syn, stop)
+    """
+    stop_idx = df.columns.get_loc("*")
+    syn_idx = df.columns.get_loc("∅")
+    missense_cols = ~df.columns.isin(["*", "∅"])
+    values = _as_f32(df).to_numpy()
+    return MutationCategories(
+        # boolean column selection already returns a new C-ordered array
+        missense=values[:, missense_cols].ravel(),
+        syn=np.ascontiguousarray(values[:, syn_idx]),
+        stop=np.ascontiguousarray(values[:, stop_idx]),
+    )
+
+
 def histogram_mutation_counts(  # pylint: disable=too-many-locals
     data: SequencingData, read_threshold: int = 20
 ) -> matplotlib.figure:
@@ -64,7 +250,6 @@ def histogram_mutation_counts(  # pylint: disable=too-many-locals
         Figure with each sample plotted on a different Subplot
     """
     counts = data.counts
-    wt_mask = heatmap_masks(data.gene)
     # num_plots = len(counts)
     # height = num_plots * 1.8
     samples = list(sorted(data.samples))
@@ -73,41 +258,43 @@ def histogram_mutation_counts(  # pylint: disable=too-many-locals
     if num_subplots / num_rows > num_rows:
         num_columns = num_rows + 1
 
-    fig, axes = plt.subplots(
+    fig, axes = _subplots(
+        "histogram_mutation_counts",
         num_rows,
         num_columns,
         figsize=(num_columns * 8, num_rows * 4),
-        constrained_layout=True,
+        layout="constrained",
         sharey=True,
         sharex=True,
     )
     fig.suptitle("Distribution of counts for all amino acids")
 
     for i, sample in enumerate(counts):
-        # ! wild-type mask
-        counts_values = counts[sample].mask(wt_mask)
         # ! these indices are specific to the mature TEM-1 protein
         # ! would need to be changed if you used a different gene
         # counts_values = data.counts[sample].loc[23:285].drop(["*", "∅"], axis=1)
-        counts_values = data.counts[sample][:-1].drop(["*", "∅"], axis=1)
-        library_size = counts_values.shape[0] * (counts_values.shape[1] - 1)
-        num_missing = counts_values.lt(read_threshold).sum().sum()
+        # * single contiguous array so the counting/log steps are one pass each,
+        # * without the stop codon row and the stop/synonymous columns
+        df_counts = data.counts[sample]
+        missense = ~df_counts.columns.isin(["*", "∅"])
+        values = np.ascontiguousarray(
+            df_counts.to_numpy(dtype=np.float64)[:-1, missense]
+        )
+        library_size = values.shape[0] * (values.shape[1] - 1)
+        num_missing = np.count_nonzero(values < read_threshold)
         pct_missing = num_missing / library_size
 
         # * all counts are included in histogram and determining mean number of reads
-        mean, _ = norm.fit(counts_values)
-        log_values = counts_values.where(
-            counts_values.lt(1), lambda x: np.log10(x + 1)
-        ).values.flatten()
+        # (the normal MLE location is just the sample mean)
+        mean = values.mean()
+        # log-transform counts >= 1, counts below 1 are left as is
+        mask = values >= 1
+        log_values = values.copy()
+        np.log10(values + 1, out=log_values, where=mask)
+        log_values = log_values.ravel()
 
         ax = axes.flat[i]
-        sns.histplot(
-            log_values,
-            bins=40,
-            fc="gray",
-            ec="black",
-            ax=ax,
-        )
+        ax.hist(log_values, bins=40, fc="gray", ec="black")
 
         ax.set_ylabel("number of amino acid mutations", fontsize=7)
         ax.set_xlabel("counts per amino acid mutation\n($log_{10}(x+1)$)", fontsize=7)
@@ -137,6 +324,7 @@ def heatmap_wrapper(
     vmax: float = 2.0,
     fitness_cmap: str = "vlag",
     orientation: str = "horizontal",
+    wt_mask: pd.DataFrame = None,
 ) -> matplotlib.axes:
     """
     Function wrapper for preferred heatmap aesthetic settings
@@ -165,6 +353,8 @@ def heatmap_wrapper(
         Colormap to use for fitness heatmap, by default "vlag"
     orientation : str, optional
         Whether to draw heatmaps vertically or horizontally, by default "horizontal"
+    wt_mask : pd.DataFrame, optional
+        Wild-type mask from `heatmap_masks`, computed from gene if not provided
 
     Returns
     -------
@@ -173,6 +363,7 @@ def heatmap_wrapper(
     """
     if ax is None:
         ax = plt.gca()
+    df = _contiguous(df)
     if dataset == "counts":
         with np.errstate(divide="ignore"):
             df = df.where(df.lt(1), np.log10(df))
@@ -183,12 +374,14 @@ def heatmap_wrapper(
         cmap = fitness_cmap
 
     xticklabels, yticklabels = 1, 1
-    df_wt = heatmap_masks(gene)
+    if wt_mask is None:
+        wt_mask = heatmap_masks(gene)
+    df_wt = wt_mask
     cbar_location = "right"
 
     if orientation == "horizontal":
         df_wt = df_wt.T
-        df = df.T
+        df = _contiguous(df.T)
         xticklabels, yticklabels = yticklabels, xticklabels
         cbar_location = "bottom"
 
@@ -206,6 +399,8 @@ def heatmap_wrapper(
         clip_on=True,
         ax=ax,
     )
+    # * rasterize only the cell mesh, labels and wild-type patches stay vector
+    h.collections[0].set_rasterized(True)
     h.set_facecolor("white")
     h.set_anchor("NW")
 
@@ -248,40 +443,41 @@ def heatmap_wrapper(
         ax.set_ylabel(name, fontweight="bold", fontsize=6, labelpad=2)
 
     # * draw and label wild-type patches
-    for j, i in np.asarray(np.where(df_wt)).T:
-        if orientation == "horizontal":
-            rotation = 80
-            fontsize = 1
-            lw = 0.35
-        elif orientation == "vertical":
-            rotation = 0
-            fontsize = 2.5
-            lw = 0.75
-        h.add_patch(
-            Rectangle((i, j), 1, 1, fill=True, color="white", ec="dimgray", lw=lw)
-        )
-        j += 0.5
-        # h.text(
-        #     i,
-        #     j,
-        #     "/",
-        #     color="black",
-        #     va="center",
-        #     fontsize=fontsize,
-        #     fontfamily="monospace",
-        #     rotation=rotation,
-        #     clip_on=True,
-        # )
+    if orientation == "horizontal":
+        rotation = 80
+        fontsize = 1
+        lw = 0.35
+    elif orientation == "vertical":
+        rotation = 0
+        fontsize = 2.5
+        lw = 0.75
+    wt_rows, wt_cols = np.where(df_wt.to_numpy())
+    h.add_collection(_cell_patches(wt_cols, wt_rows, fc="white", ec="dimgray", lw=lw))
+    # for j, i in zip(wt_rows + 0.5, wt_cols):
+    #     h.text(
+    #         i,
+    #         j,
+    #         "/",
+    #         color="black",
+    #         va="center",
+    #         fontsize=fontsize,
+    #         fontfamily="monospace",
+    #         rotation=rotation,
+    #         clip_on=True,
+    #     )
     respine(h)
-    # * reformat coordinate labeler
+    # * reformat coordinate labeler, looking up plain arrays on each mouse move
+    values = df.to_numpy()
+    row_labels = df.index.to_numpy()
+    col_labels = df.columns.to_numpy()
     if orientation == "vertical":
 
         def format_coord(x, y):
             x = np.floor(x).astype("int")
             y = np.floor(y).astype("int")
-            residue = df.columns[x]
-            pos = df.index[y]
-            fitness_score = df.loc[pos, residue].round(4)
+            residue = col_labels[x]
+            pos = row_labels[y]
+            fitness_score = values[y, x].round(4)
             return f"position: {pos}, residue: {residue}, fitness: {fitness_score}"
 
     elif orientation == "horizontal":
@@ -289,9 +485,9 @@ def heatmap_wrapper(
         def format_coord(x, y):
             x = np.floor(x).astype("int")
             y = np.floor(y).astype("int")
-            pos = df.columns[x]
-            residue = df.index[y]
-            fitness_score = df.loc[residue, pos].round(4)
+            pos = col_labels[x]
+            residue = row_labels[y]
+            fitness_score = values[y, x].round(4)
             return f"position: {pos}, residue: {residue}, fitness: {fitness_score}"
 
     ax.format_coord = format_coord
@@ -358,22 +554,61 @@ def heatmap_draw(
         if dataset == "fitness":
             df_dict, num_columns, num_rows, suptitle = params_fitness.values()
 
+    # * lay out the Figure from the known table dimensions (square cells) so
+    # * that it doesn't have to be measured and re-sized after drawing
+    num_positions, num_residues = wt_mask.shape
+    axes_width = 12
+    # suptitle sits title_pad below the top edge, the top margin fits it plus
+    # the sample titles/tick labels drawn above the heatmaps
+    title_pad = 0.1
+    title_size = FontProperties(size=plt.rcParams["figure.titlesize"])
+    title_height = 1.2 * title_size.get_size_in_points() / 72
+    top = title_pad + title_height + 0.25
     if orientation == "horizontal":
         num_columns, num_rows = num_rows, num_columns
-        cbar_location = "bottom"
+        # margins (inches) for labels and colorbar
+        left, right, bottom = 0.5, 0.2, 0.5
+        hspace, wspace = 0.1, 0
+        cell = axes_width / num_positions
+        axes_height = num_residues * cell * (num_rows + (num_rows - 1) * hspace)
     else:
-        cbar_location = "right"
-
-    fig, axs = plt.subplots(
+        left, right, bottom = 0.4, 0.6, 0.3
+        hspace, wspace = 0, 0.1
+        # * fill the width, unless that makes the heatmaps taller than
+        # * max_axes_height (few samples), then narrow them instead
+        max_axes_height = 10.8
+        residue_cells = num_residues * (num_columns + (num_columns - 1) * wspace)
+        cell = min(axes_width / residue_cells, max_axes_height / num_positions)
+        axes_width = cell * residue_cells
+        axes_height = num_positions * cell
+    # keep narrow figures wide enough for the suptitle
+    fig_width = max(left + axes_width + right, 4)
+    fig_height = top + axes_height + bottom
+
+    fig, axs = _subplots(
+        "heatmap_draw",
         num_rows,
         num_columns,
-        figsize=(12, 12),
+        figsize=(fig_width, fig_height),
         dpi=300,
-        layout="compressed",
         sharex=True,
         sharey=True,
+        gridspec_kw={
+            "left": left / fig_width,
+            "right": (left + axes_width) / fig_width,
+            "top": 1 - top / fig_height,
+            "bottom": bottom / fig_height,
+            "hspace": hspace,
+            "wspace": wspace,
+        },
     )
-    fig.suptitle(suptitle, fontweight="bold")
+    fig.suptitle(suptitle, fontweight="bold", y=1 - title_pad / fig_height, va="top")
+
+    if dataset == "fitness":
+        # * will use filtered data here, but default is to not filter (i.e. read_threshold=1)
+        dfs_filtered = filter_fitness_read_noise(
+            counts_dict, fitness_dict, read_threshold=read_threshold
+        )
 
     # * plot each data one by one
     for i, sample in enumerate(sorted(counts_dict)):
@@ -387,14 +622,11 @@ def heatmap_draw(
                 dataset=dataset,
                 ax=axs[i],
                 orientation=orientation,
+                wt_mask=wt_mask,
             )
         elif dataset == "fitness":
-            # * will use filtered data here, but default is to not filter (i.e. read_threshold=1)
             if "UT" in sample:
                 continue
-            dfs_filtered = filter_fitness_read_noise(
-                counts_dict, fitness_dict, read_threshold=read_threshold
-            )
             data = dfs_filtered[sample].mask(wt_mask)
             heatmap_wrapper(
                 data,
@@ -406,39 +638,36 @@ def heatmap_draw(
                 vmax=vmax,
                 fitness_cmap=fitness_cmap,
                 orientation=orientation,
+                wt_mask=wt_mask,
             )
     if orientation == "horizontal":
-        # * re-size Figure down to height of all subplots combined after plotting
-        height = 0
         for ax in fig.axes:
             ax.tick_params(labelleft=True)
-            height += (
-                ax.get_tightbbox().transformed(fig.dpi_scale_trans.inverted()).height
-            )
         fig.axes[0].tick_params(labeltop=True)
-        fig.set_figheight(height + 1)
-        # * adjust subplot spacing
-        pad = fig.get_layout_engine().get()["hspace"] / 2
-
+        # * colorbar below the heatmaps, 1/5 of their width
+        cbar_rect = [
+            left / fig_width,
+            (bottom - 0.25) / fig_height,
+            0.2 * axes_width / fig_width,
+            0.08 / fig_height,
+        ]
     elif orientation == "vertical":
         for ax in fig.axes:
             ax.tick_params(labelbottom=True)
         fig.axes[0].tick_params(labelleft=True)
-        # * re-size Figure down
-        fig.set_figheight(fig.get_tightbbox().height)
-        # * adjust sutplob spacing
-        pad = fig.get_layout_engine().get()["wspace"] / 2
+        # * colorbar right of the heatmaps, 1/5 of their height
+        cbar_rect = [
+            (left + axes_width + 0.1) / fig_width,
+            1 - (top + 0.2 * axes_height) / fig_height,
+            0.08 / fig_width,
+            0.2 * axes_height / fig_height,
+        ]
 
     # * add colorbar
     cbar = fig.colorbar(
         axs[0].collections[0],
-        ax=fig.axes,
-        shrink=0.2,
-        fraction=0.1,
-        pad=pad,
-        anchor="NW",
-        location=cbar_location,
-        use_gridspec=True,
+        cax=fig.add_axes(cbar_rect),
+        orientation=orientation,
     )
     cbar.ax.spines["outline"].set_lw(0.4)
     cbar.ax.tick_params(right=False, left=False, labelsize=4, length=0, pad=3)
@@ -467,6 +696,9 @@ def relabel_axis(
     # * df for adjusting interactive hover annotations
     df_wt = heatmap_masks(gene)
     rows, cols = df_wt.shape
+    # * plain arrays so hover lookups skip pandas indexing
+    residues = df_wt.columns.to_numpy()
+    ambler = np.asarray(gene.ambler_numbering)
     if orientation == "vertical":
         fig.axes[0].set_yticklabels(
             np.take(
@@ -476,12 +708,12 @@ def relabel_axis(
         for ax in fig.axes[:-1]:
             data = ax.collections[0].get_array().data.reshape(rows, cols)
             # * adjust jupyter widget interactive hover values
-            def format_coord(x, y):
+            def format_coord(x, y, data=data):
                 x = np.floor(x).astype("int")
                 y = np.floor(y).astype("int")
-                residue = df_wt.columns[x]
-                pos = np.take(gene.ambler_numbering, y)
-                value = data[y, x].round(4)  # pylint: disable=cell-var-from-loop
+                residue = residues[x]
+                pos = ambler[y]
+                value = data[y, x].round(4)
                 return f"position: {pos}, residue: {residue}, value: {value}"
 
             ax.format_coord = format_coord
@@ -495,12 +727,12 @@ def relabel_axis(
             data = ax.collections[0].get_array().data.reshape(rows, cols)
 
             # * adjust jupyter widget interactive hover values
-            def format_coord(x, y):
+            def format_coord(x, y, data=data):
                 x = np.floor(x).astype("int")
                 y = np.floor(y).astype("int")
-                residue = df_wt.columns[y]
-                pos = np.take(gene.ambler_numbering, x)
-                value = data[y, x].round(4)  # pylint: disable=cell-var-from-loop
+                residue = residues[y]
+                pos = ambler[x]
+                value = data[y, x].round(4)
                 return f"position: {pos}, residue: {residue}, value: {value}"
 
             ax.format_coord = format_coord
@@ -553,56 +785,23 @@ def histogram_fitness_wrapper(
     # ! TEM-1 mat peptide
     df_fitness = df_fitness.loc[23:285]
     df_extinct = df_extinct.loc[23:285]
-    # selecting missense mutations
-    values_missense = df_fitness.drop(["*", "∅"], axis=1).values.flatten()
-    # synonymous mutants
-    values_syn = df_fitness["∅"].values.flatten()
-    # stop mutations
-    values_stop = df_fitness["*"].values.flatten()
+    # * missense, synonymous, and stop mutations
+    values_fitness = split_categories(df_fitness)
     # extinct mutations
-    values_extinct = df_extinct.drop(["*", "∅"], axis=1).values.flatten()
-
-    sns.histplot(
-        values_missense,
-        bins=bins,
-        ax=ax,
-        color="gray",
-        ec="white",
-        alpha=0.6,
-        label="missense",
-        zorder=99,
-    )
-    sns.histplot(
-        values_syn,
-        bins=bins,
-        ax=ax,
-        color="greenyellow",
-        ec="white",
-        alpha=0.6,
-        label="synonymous",
-        zorder=101,
-    )
-    sns.histplot(
-        values_stop,
-        bins=bins,
-        ax=ax,
-        color="lightcoral",
-        ec="white",
-        lw=0.6,
-        alpha=0.6,
-        label="stop mutations",
-        zorder=101,
-    )
-    sns.histplot(
-        values_extinct,
-        bins=bins,
-        ax=ax,
-        color="steelblue",
-        ec="white",
-        alpha=0.6,
-        label="extinct",
-        zorder=100,
-    )
+    values_extinct = split_categories(df_extinct).missense
+
+    # * plain matplotlib histograms, NaN values are dropped first
+    hist_layers = [
+        (values_fitness.missense, dict(color="gray", label="missense", zorder=99)),
+        (values_fitness.syn, dict(color="greenyellow", label="synonymous", zorder=101)),
+        (
+            values_fitness.stop,
+            dict(color="lightcoral", lw=0.6, label="stop mutations", zorder=101),
+        ),
+        (values_extinct, dict(color="steelblue", label="extinct", zorder=100)),
+    ]
+    for values, hist_kws in hist_layers:
+        ax.hist(values[~np.isnan(values)], bins=bins, ec="white", alpha=0.6, **hist_kws)
 
     ax.set_title(sample, fontweight="bold")
     # ax.set_xlabel("distribution of fitness effects")
@@ -643,15 +842,19 @@ def histogram_fitness_draw(
     )
 
     # get bins for histogram
-    values_fitness_all = []
-    for value in dfs_fitness_filt.values():
-        value = value.mask(wt_mask)
-        values_fitness_all.extend(value.values)
+    wt_cells = wt_mask.to_numpy()
+    values_fitness_all = np.concatenate(
+        [
+            np.where(wt_cells, np.nan, _as_f32(value).to_numpy()).ravel()
+            for value in dfs_fitness_filt.values()
+        ]
+    )
     bins = np.linspace(np.nanmin(values_fitness_all), np.nanmax(values_fitness_all), 60)
 
     # start drawing
     with sns.axes_style("whitegrid"):
-        fig_dfe_all, axs = plt.subplots(
+        fig_dfe_all, axs = _subplots(
+            "histogram_fitness_draw",
             num_rows,
             num_columns,
             figsize=(10, 8),
@@ -664,7 +867,7 @@ def histogram_fitness_draw(
         if "UT" in sample:
             continue
         # untreated = match_treated_untreated(sample)
-        df_fitness_sample = fitness_dict[sample].mask(wt_mask)
+        df_fitness_sample = _as_f32(fitness_dict[sample].mask(wt_mask))
         df_fitness_sample.name = sample
         fig_dfe_all.suptitle(
             f"Distribution of fitness effects (min. reads = {read_threshold})",
@@ -688,6 +891,156 @@ def histogram_fitness_draw(
     return fig_dfe_all
 
 
+DrugSignificance = namedtuple(
+    "DrugSignificance", ["df_x", "df_y", "sensitive", "resistant", "ellipses"]
+)
+
+
+def _drug_replicates(
+    drug: str,
+    data: SequencingData,
+    dfs_filtered: dict,
+    wt_mask: pd.DataFrame,
+    rows: tuple[int, int] = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    drug_x, drug_y = get_pairs(drug, data.samples)
+    df_x = dfs_filtered[drug_x].mask(wt_mask)
+    df_y = dfs_filtered[drug_y].mask(wt_mask)
+    if rows is not None:
+        df_x = df_x.loc[rows[0] : rows[1]]
+        df_y = df_y.loc[rows[0] : rows[1]]
+    return df_x, df_y
+
+
+def _significance(
+    df_x: pd.DataFrame, df_y: pd.DataFrame, sigma_cutoff: int = 4
+) -> DrugSignificance:
+    sensitive, resistant, ellipses = gaussian_significance(
+        df_x, df_y, sigma_cutoff=sigma_cutoff
+    )
+    return DrugSignificance(df_x, df_y, sensitive, resistant, ellipses)
+
+
+# * _drug_significance results keyed on (drug, samples, id(counts), id(fitness),
+# * id(gene), read_threshold, sigma_cutoff, rows), entries keep a reference to
+# * the dicts and gene so that their ids can't be reused
+_SIGNIFICANCE_CACHE_SIZE = 32
+_significance_cache = OrderedDict()
+
+
+def clear_significance_cache() -> None:
+    """
+    Empty the cache used by `drug_significance`. Needed if the counts or
+    fitness DataFrames of a dataset are modified in place.
+
+    Returns
+    -------
+    None
+    """
+    _significance_cache.clear()
+
+
+def _significance_key(
+    drug: str,
+    data: SequencingData,
+    read_threshold: int,
+    sigma_cutoff: int,
+    rows: tuple[int, int],
+) -> tuple:
+    return (
+        drug,
+        tuple(data.samples),
+        id(data.counts),
+        id(data.fitness),
+        id(data.gene),
+        read_threshold,
+        sigma_cutoff,
+        rows,
+    )
+
+
+def _store_significance(
+    key: tuple, data: SequencingData, significance: DrugSignificance
+) -> None:
+    _significance_cache[key] = ((data.counts, data.fitness, data.gene), significance)
+    if len(_significance_cache) > _SIGNIFICANCE_CACHE_SIZE:
+        _significance_cache.popitem(last=False)
+
+
+def _drug_significance(
+    drug: str,
+    data: SequencingData,
+    read_threshold: int = 20,
+    sigma_cutoff: int = 4,
+    rows: tuple[int, int] = None,
+) -> DrugSignificance:
+    # ! returns the cached tables themselves, only for plotters that don't modify them
+    key = _significance_key(drug, data, read_threshold, sigma_cutoff, rows)
+    if key in _significance_cache:
+        _significance_cache.move_to_end(key)
+        return _significance_cache[key][1]
+    # * always filter here (itself cached) so the fit matches its cache key
+    dfs_filtered = filter_fitness_read_noise(
+        data.counts, data.fitness, read_threshold=read_threshold
+    )
+    df_x, df_y = _drug_replicates(
+        drug, data, dfs_filtered, heatmap_masks(data.gene), rows
+    )
+    significance = _significance(df_x, df_y, sigma_cutoff=sigma_cutoff)
+    _store_significance(key, data, significance)
+    return significance
+
+
+def drug_significance(
+    drug: str,
+    data: SequencingData,
+    read_threshold: int = 20,
+    sigma_cutoff: int = 4,
+    rows: tuple[int, int] = None,
+) -> DrugSignificance:
+    """
+    Find the significantly sensitive and resistant mutations for a drug from
+    its two replicates. Fits are cached, so the plots of the same drug
+    (e.g. shish kabob and drug pairs) share a single fit, and a copy of the
+    cached result is returned here.
+
+    Parameters
+    ----------
+    drug : str
+        Drug to find the significant mutations for
+    data : SequencingData
+        Data from experiment sequencing with count-, enrichment-, and fitness-values
+    read_threshold : int, optional
+        Minimum number of reads required to be included, by default 20
+    sigma_cutoff : int, optional
+        How many sigmas away from the synonymous mutation values to use as the
+        cutoff for significance, by default 4
+    rows : tuple[int, int], optional
+        First and last residue position (inclusive) to keep, by default None
+        (all positions)
+
+    Returns
+    -------
+    DrugSignificance
+        Filtered replicate tables with wild-type cells masked, significantly
+        sensitive and resistant cells, and the significance ellipses
+    """
+    significance = _drug_significance(
+        drug,
+        data,
+        read_threshold=read_threshold,
+        sigma_cutoff=sigma_cutoff,
+        rows=rows,
+    )
+    return DrugSignificance(
+        significance.df_x.copy(),
+        significance.df_y.copy(),
+        significance.sensitive.copy(),
+        significance.resistant.copy(),
+        copy.deepcopy(significance.ellipses),
+    )
+
+
 def gaussian_drug(
     drug: str,
     data: SequencingData,
@@ -696,28 +1049,26 @@ def gaussian_drug(
     ax: matplotlib.axes = None,
     xlim: tuple[float, float] = (-2.5, 2.5),
     ylim: tuple[float, float] = (-2.5, 2.5),
+    backend: str = "matplotlib",
 ) -> matplotlib.axes:
-    counts_dict = data.counts
-    fitness_dict = data.fitness
-    gene = data.gene
-    wt_mask = heatmap_masks(gene)
-
+    if backend not in ("matplotlib", "datashader"):
+        raise ValueError(f"Unknown backend: {backend}")
     x, y = get_pairs(drug, data.samples)
-    dfs_filtered = filter_fitness_read_noise(
-        counts_dict, fitness_dict, read_threshold=read_threshold
-    )
-    df_x = dfs_filtered[x]
-    df_y = dfs_filtered[y]
-    df_x = df_x.mask(wt_mask)
-    df_y = df_y.mask(wt_mask)
-    df_x = df_x.loc[23:285]
-    df_y = df_y.loc[23:285]
-
-    sign_sensitive, sign_resistant, ellipses_all = gaussian_significance(
-        df_x,
-        df_y,
+    # ! these indices are specific to the mature TEM-1 protein
+    # ! would need to be changed if you used a different gene
+    significance = _drug_significance(
+        drug,
+        data,
+        read_threshold=read_threshold,
         sigma_cutoff=sigma_cutoff,
+        rows=(23, 285),
     )
+    sign_sensitive = significance.sensitive
+    sign_resistant = significance.resistant
+    ellipses_all = significance.ellipses
+    # * significance is determined at full precision, plotting only needs float32
+    df_x = _as_f32(significance.df_x)
+    df_y = _as_f32(significance.df_y)
     if ax is None:
         ax = plt.gca()
 
@@ -737,53 +1088,39 @@ def gaussian_drug(
             )
         )
 
-    # * construct numpy matrix of all fitness values for plotting
-    X = np.column_stack((df_x.values.flatten(), df_y.values.flatten()))
-    # filter NaN in pairs
-    X = X[np.isfinite(X).all(axis=1)]
-
-    # * scatterplots
+    # * flatten fitness values and drop pairs with NaN for plotting
+    values_x = df_x.to_numpy().ravel()
+    values_y = df_y.to_numpy().ravel()
+    x_all, y_all = pair_finite(values_x, values_y)
+    x_syn, y_syn = pair_finite(df_x["∅"].to_numpy(), df_y["∅"].to_numpy())
+    resistant = sign_resistant.to_numpy(dtype=bool).ravel()
+    x_resistant, y_resistant = pair_finite(values_x[resistant], values_y[resistant])
+    sensitive = sign_sensitive.to_numpy(dtype=bool).ravel()
+    x_sensitive, y_sensitive = pair_finite(values_x[sensitive], values_y[sensitive])
+
+    # * scatterplots (thin white marker edges, as seaborn draws them)
+    scatter_kws = dict(s=5, ec="white", lw=_SCATTER_EDGE_LW)
     # all mutations
-    sns.scatterplot(
-        x=X[:, 0],
-        y=X[:, 1],
-        zorder=-1,
-        ax=ax,
-        plotnonfinite=False,
-        color="gray",
-        lw=2,
-        s=5,
-    )
+    if backend == "datashader":
+        # * rasterize the (potentially very large) background layer
+        import datashader as ds  # pylint: disable=import-outside-toplevel
+        from datashader.mpl_ext import dsshow  # pylint: disable=import-outside-toplevel
+
+        dsshow(
+            pd.DataFrame({"x": x_all, "y": y_all}),
+            ds.Point("x", "y"),
+            cmap="Greys",
+            ax=ax,
+            zorder=-1,
+        )
+    else:
+        ax.scatter(x_all, y_all, color="gray", zorder=-1, **scatter_kws)
     # synonymous mutations
-    sns.scatterplot(
-        x=df_x["∅"],
-        y=df_y["∅"],
-        ax=ax,
-        plotnonfinite=False,
-        color="yellowgreen",
-        lw=0.5,
-        s=5,
-    )
+    ax.scatter(x_syn, y_syn, color="yellowgreen", **scatter_kws)
     # resistant mutations
-    sns.scatterplot(
-        x=df_x[sign_resistant].values.flatten(),
-        y=df_y[sign_resistant].values.flatten(),
-        ax=ax,
-        plotnonfinite=False,
-        color="lightcoral",
-        lw=0.5,
-        s=5,
-    )
+    ax.scatter(x_resistant, y_resistant, color="lightcoral", **scatter_kws)
     # sensitive mutations
-    sns.scatterplot(
-        x=df_x[sign_sensitive].values.flatten(),
-        y=df_y[sign_sensitive].values.flatten(),
-        ax=ax,
-        plotnonfinite=False,
-        color="dodgerblue",
-        lw=0.5,
-        s=5,
-    )
+    ax.scatter(x_sensitive, y_sensitive, color="dodgerblue", **scatter_kws)
 
     # * axis lines and limits
     # diagonal
@@ -805,6 +1142,7 @@ def gaussian_replica_pair_draw(
     sigma_cutoff: int = 4,
     xlim: tuple[float, float] = (-2.5, 2.5),
     ylim: tuple[float, float] = (-2.5, 2.5),
+    backend: str = "matplotlib",
 ) -> matplotlib.figure:
     """
     Draws the full figure of gaussian significance scatterplots for all drugs
@@ -824,6 +1162,10 @@ def gaussian_replica_pair_draw(
         X-axis limits of figure, by default (-2.5, 2.5)
     ylim : tuple[float, float], optional
         Y-axis limits of figure, by default (-2.5, 2.5)
+    backend : str, optional
+        How to draw the layer of all mutations, either "matplotlib" (scatter)
+        or "datashader" (rasterized density, requires datashader), by default
+        "matplotlib"
 
     Returns
     -------
@@ -841,7 +1183,14 @@ def gaussian_replica_pair_draw(
     cols = int(cols)
 
     # * begin drawing
-    fig, axs = plt.subplots(rows, cols, figsize=(10, 10), layout="compressed", dpi=300)
+    fig, axs = _subplots(
+        "gaussian_replica_pair_draw",
+        rows,
+        cols,
+        figsize=(10, 10),
+        layout="compressed",
+        dpi=300,
+    )
     for i, drug in enumerate(sorted(drugs_all)):
         ax = axs.flat[i]
         gaussian_drug(
@@ -852,6 +1201,7 @@ def gaussian_replica_pair_draw(
             ax=ax,
             xlim=xlim,
             ylim=ylim,
+            backend=backend,
         )
     while len(fig.axes) > num_plots:
         fig.axes[-1].remove()
@@ -898,39 +1248,39 @@ def shish_kabob_drug(
     -------
     ax : matplotlib.axes
     """
-    fitness_dict = data.fitness
-    counts_dict = data.counts
     gene = data.gene
-    wt_mask = heatmap_masks(gene)
-
-    replica_one, replica_two = get_pairs(drug, data.samples)
-    dfs_filtered = filter_fitness_read_noise(
-        counts_dict, fitness_dict, read_threshold=read_threshold
-    )
-    df1 = dfs_filtered[replica_one]
-    df2 = dfs_filtered[replica_two]
-    df1 = df1.mask(wt_mask)
-    df2 = df2.mask(wt_mask)
-
-    sign_sensitive, sign_resistant, _ = gaussian_significance(
-        df1,
-        df2,
+    significance = _drug_significance(
+        drug,
+        data,
+        read_threshold=read_threshold,
         sigma_cutoff=sigma_cutoff,
     )
+    df1 = significance.df_x
+    df2 = significance.df_y
+    sign_sensitive = significance.sensitive
+    sign_resistant = significance.resistant
 
     if ax is None:
         ax = plt.gca()
         # * get residue positions with significant mutations
-    sign_positions = (
-        sign_sensitive.drop("*", axis=1) | sign_resistant.drop("*", axis=1)
-    ).sum(axis=1) > 0
-    sign_positions = sign_positions[sign_positions].index
+    sign_positions = positions_with_signal(
+        sign_sensitive.to_numpy(dtype=bool),
+        sign_resistant.to_numpy(dtype=bool),
+        sign_sensitive.columns.get_loc("*"),
+    )
+    sign_positions = sign_sensitive.index[sign_positions]
     # * find fitness value of greatest magnitude between pair
-    df = df1[df1.abs().ge(df2.abs())]
-    df.update(df2[df2.abs().ge(df1.abs())])
+    values1 = df1.to_numpy()
+    values2 = df2.to_numpy()
+    values = np.where(np.abs(values1) > np.abs(values2), values1, values2)
     # * select only mutations with significant fitness values
-    df_masked = df.where(sign_resistant | sign_sensitive)
-    df_masked = df_masked.drop("∅", axis=1)
+    significant = sign_resistant.to_numpy(dtype=bool) | sign_sensitive.to_numpy(
+        dtype=bool
+    )
+    df_masked = pd.DataFrame(
+        np.where(significant, values, np.nan), index=df1.index, columns=df1.columns
+    )
+    df_masked = _as_f32(df_masked.drop("∅", axis=1))
 
     with sns.axes_style("white"):
         if orientation == "vertical":
@@ -956,14 +1306,15 @@ def shish_kabob_drug(
             ax.set_xticks([])
             # * add wild-type notations
             # get reference residues
-            ref_aas = np.take(gene.cds_translation, sign_positions)
-            # iterate over amino acid options (y-axis)
-            for y, residue in enumerate(ref_aas):
-                # determine x position for text box
-                x = df_masked_plot.columns.get_loc(residue)
-                ax.add_patch(
-                    Rectangle((x, y), 1, 1, ec="black", fc="white", fill=True, lw=0.2)
+            ref_aas = gene.cds_translation_array[sign_positions]
+            # x position of the reference residue for each position (y-axis)
+            wt_xs = df_masked_plot.columns.get_indexer(ref_aas)
+            ax.add_collection(
+                _cell_patches(
+                    wt_xs, np.arange(len(wt_xs)), ec="black", fc="white", lw=0.2
                 )
+            )
+            for y, (x, residue) in enumerate(zip(wt_xs, ref_aas)):
                 ax.text(
                     x + 0.5,
                     y + 0.5,
@@ -973,21 +1324,19 @@ def shish_kabob_drug(
                     va="center",
                 )
             # * annotate fitness boxes
-            # iterate over the x-axis (positions)
-            for x, aa in enumerate(df_masked_plot.columns):
-                # the significant positions of each amino acid mutation
-                # determinates y-coord for text box
-                pos_indices = np.argwhere(df_masked_plot[aa].notnull().values)
-                for y in pos_indices:
-                    ax.text(
-                        x + 0.5,
-                        y + 0.5,
-                        aa,
-                        fontsize="x-small",
-                        ha="center",
-                        va="center",
-                        color="white",
-                    )
+            # coordinates of all significant mutations, labelled by amino acid (x-axis)
+            ys, xs = np.nonzero(df_masked_plot.notnull().to_numpy())
+            labels = df_masked_plot.columns.to_numpy()[xs]
+            for x, y, aa in zip(xs, ys, labels):
+                ax.text(
+                    x + 0.5,
+                    y + 0.5,
+                    aa,
+                    fontsize="x-small",
+                    ha="center",
+                    va="center",
+                    color="white",
+                )
             ax.set_title(drug, fontweight="heavy")
             ax.set_anchor("N")
 
@@ -1013,25 +1362,22 @@ def shish_kabob_drug(
                 fontsize="xx-small",
             )
             ax.set_yticks([])
-            # * annotate fitness boxes
+            # * add wild-type notations
             # get reference residues
-            ref_aas = np.take(gene.cds_translation, sign_positions)
-            # iterate in the x-direction (significant positions)
-            for x, residue in enumerate(ref_aas):
-                # determine y-coord for text box
-                y = df_masked.index.get_loc(residue)
-                ax.add_patch(
-                    Rectangle(
-                        (x, y),
-                        1,
-                        1,
-                        ec="black",
-                        fc="white",
-                        fill=True,
-                        lw=0.2,
-                        clip_on=False,
-                    )
+            ref_aas = gene.cds_translation_array[sign_positions]
+            # y-coord of the reference residue for each significant position (x-axis)
+            wt_ys = df_masked.index.get_indexer(ref_aas)
+            ax.add_collection(
+                _cell_patches(
+                    np.arange(len(wt_ys)),
+                    wt_ys,
+                    ec="black",
+                    fc="white",
+                    lw=0.2,
+                    clip_on=False,
                 )
+            )
+            for x, (y, residue) in enumerate(zip(wt_ys, ref_aas)):
                 ax.text(
                     x + 0.5,
                     y + 0.5,
@@ -1040,19 +1386,20 @@ def shish_kabob_drug(
                     ha="center",
                     va="center",
                 )
-            for x, pos in enumerate(sign_positions):
-                aa_indices = np.argwhere(df_masked_plot[pos].notnull().values)
-                for y in aa_indices:
-                    aa = df_masked_plot.index[y].values[0]
-                    ax.text(
-                        x + 0.5,
-                        y + 0.5,
-                        aa,
-                        fontsize="x-small",
-                        ha="center",
-                        va="center",
-                        color="white",
-                    )
+            # * annotate fitness boxes
+            # coordinates of all significant mutations, labelled by amino acid (y-axis)
+            ys, xs = np.nonzero(df_masked_plot.notnull().to_numpy())
+            labels = df_masked_plot.index.to_numpy()[ys]
+            for x, y, aa in zip(xs, ys, labels):
+                ax.text(
+                    x + 0.5,
+                    y + 0.5,
+                    aa,
+                    fontsize="x-small",
+                    ha="center",
+                    va="center",
+                    color="white",
+                )
             ax.set_ylabel(drug, fontweight="heavy")
         return ax
 
@@ -1109,7 +1456,8 @@ def shish_kabob_draw(
         figsize = (17, 7)
 
     with sns.axes_style("white"):
-        fig, axs = plt.subplots(
+        fig, axs = _subplots(
+            "shish_kabob_draw",
             num_rows,
             num_cols,
             figsize=figsize,
@@ -1164,6 +1512,59 @@ def shish_kabob_draw(
     return fig
 
 
+def _mean_replicates(df_x: pd.DataFrame, df_y: pd.DataFrame) -> pd.DataFrame:
+    """
+    Elementwise mean of two replicate tables in a single NumPy pass, a cell
+    missing from one replicate takes the value of the other
+
+    Parameters
+    ----------
+    df_x : pd.DataFrame
+        Values of the first replicate
+    df_y : pd.DataFrame
+        Values of the second replicate, with the same labels as df_x
+
+    Returns
+    -------
+    pd.DataFrame
+        Mean of the replicates
+    """
+    assert df_x.index.equals(df_y.index) and df_x.columns.equals(df_y.columns)
+    with warnings.catch_warnings():
+        # cells missing from both replicates stay NaN
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        values = np.nanmean(np.stack([df_x.to_numpy(), df_y.to_numpy()]), axis=0)
+    return pd.DataFrame(values, index=df_x.index, columns=df_x.columns)
+
+
+DrugStats = namedtuple("DrugStats", ["values", "sensitive", "resistant"])
+
+
+def drug_stats(significance: DrugSignificance) -> DrugStats:
+    """
+    Replicate-mean fitness values and significance masks for one drug, used
+    by `drug_pair`
+
+    Parameters
+    ----------
+    significance : DrugSignificance
+        Output of `drug_significance` for the drug
+
+    Returns
+    -------
+    DrugStats
+        Flattened arrays of mean fitness values and of significantly sensitive
+        and resistant mutations
+    """
+    # * find mean of fitness values between replicates
+    df_xy = _mean_replicates(significance.df_x, significance.df_y)
+    return DrugStats(
+        df_xy.to_numpy().ravel(),
+        significance.sensitive.to_numpy(dtype=bool).ravel(),
+        significance.resistant.to_numpy(dtype=bool).ravel(),
+    )
+
+
 def drug_pair(
     drug1: str,
     drug2: str,
@@ -1173,6 +1574,9 @@ def drug_pair(
     sigma_cutoff: int = 4,
     xlim: tuple[float, float] = (-2.5, 2.5),
     ylim: tuple[float, float] = (-2.5, 2.5),
+    stats1: DrugStats = None,
+    stats2: DrugStats = None,
+    background: str = "scatter",
 ) -> None:
     """
     Find common significant resistance/sensitivity mutations between two different drugs
@@ -1200,119 +1604,80 @@ def drug_pair(
         X-axis limits of figure, by default (-2.5, 2.5)
     ylim : tuple[float, float], optional
         y-axis limits of figure, by default (-2.5, 2.5)
+    stats1 : DrugStats, optional
+        Output of `drug_stats` for drug1 to reuse, computed if not provided
+    stats2 : DrugStats, optional
+        Output of `drug_stats` for drug2 to reuse, computed if not provided
+    background : str, optional
+        How to draw the layer of all mutations, either "scatter" (one marker
+        per mutation) or "hexbin" (binned counts), by default "scatter"
     """
-    counts_dict = data.counts
-    fitness_dict = data.fitness
-    gene = data.gene
-
+    if background not in ("scatter", "hexbin"):
+        raise ValueError(f"Unknown background: {background}")
     if ax is None:
         ax = plt.gca()
-    wt_mask = heatmap_masks(gene)
     # * get cells of significant mutations
-    dfs_filtered = filter_fitness_read_noise(
-        counts_dict, fitness_dict, read_threshold=read_threshold
-    )
-    # drug 1
-    drug1_x, drug1_y = get_pairs(drug1, data.samples)
-    df1_x = dfs_filtered[drug1_x].mask(wt_mask)
-    df1_y = dfs_filtered[drug1_y].mask(wt_mask)
-    df_sign_sensitive1, df_sign_resistant1, _ = gaussian_significance(
-        df1_x, df1_y, sigma_cutoff=sigma_cutoff
-    )
-    # drug 2
-    drug2_x, drug2_y = get_pairs(drug2, data.samples)
-    df2_x = dfs_filtered[drug2_x].mask(wt_mask)
-    df2_y = dfs_filtered[drug2_y].mask(wt_mask)
-    df_sign_sensitive2, df_sign_resistant2, _ = gaussian_significance(
-        df2_x, df2_y, sigma_cutoff=sigma_cutoff
-    )
-    # * find mean of fitness values between replicates
-    df1_xy = pd.concat([df1_x, df1_y]).groupby(level=0, axis=0).agg(np.mean)
-    df2_xy = pd.concat([df2_x, df2_y]).groupby(level=0, axis=0).agg(np.mean)
-    # * build numpy matrix of all points for plotting
-    X = np.column_stack((df1_xy.values.flatten(), df2_xy.values.flatten()))
-    X = X[np.isfinite(X).all(axis=1)]
+    if stats1 is None:
+        stats1 = drug_stats(
+            _drug_significance(
+                drug1,
+                data,
+                read_threshold=read_threshold,
+                sigma_cutoff=sigma_cutoff,
+            )
+        )
+    if stats2 is None:
+        stats2 = drug_stats(
+            _drug_significance(
+                drug2,
+                data,
+                read_threshold=read_threshold,
+                sigma_cutoff=sigma_cutoff,
+            )
+        )
+    # * combine points and significance categories of both drugs for plotting
+    values1 = stats1.values
+    values2 = stats2.values
+    finite = np.isfinite(values1) & np.isfinite(values2)
+    sensitive = stats1.sensitive | stats2.sensitive
+    resistant = stats1.resistant | stats2.resistant
+    shared_sensitive = stats1.sensitive & stats2.sensitive
+    shared_resistant = stats1.resistant & stats2.resistant
+    scatter_kws = dict(s=5, ec="white", lw=_SCATTER_EDGE_LW, rasterized=True)
 
     # * scatterplots
-    # all mutations
-    sns.scatterplot(
-        x=X[:, 0],
-        y=X[:, 1],
-        zorder=-1,
-        ax=ax,
-        plotnonfinite=False,
-        color="gray",
-        lw=2,
-        s=5,
-    )
-    # * sensitive mutations
-    # drug 1 sensitive mutations
-    sns.scatterplot(
-        x=df1_xy[df_sign_sensitive1].values.flatten(),
-        y=df2_xy[df_sign_sensitive1].values.flatten(),
-        ax=ax,
-        plotnonfinite=False,
-        color="dodgerblue",
-        lw=2,
-        s=5,
-    )
-    # drug 2 sensitive mutations
-    sns.scatterplot(
-        x=df1_xy[df_sign_sensitive2].values.flatten(),
-        y=df2_xy[df_sign_sensitive2].values.flatten(),
-        ax=ax,
-        plotnonfinite=False,
-        color="dodgerblue",
-        lw=2,
-        s=5,
-    )
-    # drug1-drug2 shared sensitive mutations
-    shared_sensitive_1 = df1_xy.where(df_sign_sensitive1 & df_sign_sensitive2)
-    shared_sensitive_2 = df2_xy.where(df_sign_sensitive1 & df_sign_sensitive2)
-    sns.scatterplot(
-        x=shared_sensitive_1.values.flatten(),
-        y=shared_sensitive_2.values.flatten(),
-        ax=ax,
-        plotnonfinite=False,
-        color="mediumblue",
-        lw=2,
-        s=5,
-        marker="D",
-    )
-    # * resistance mutations
-    # drug 1 resistance mutations
-    sns.scatterplot(
-        x=df1_xy[df_sign_resistant1].values.flatten(),
-        y=df2_xy[df_sign_resistant1].values.flatten(),
-        ax=ax,
-        plotnonfinite=False,
-        color="lightcoral",
-        lw=2,
-        s=5,
-    )
-    # drug 2 resistance mutations
-    sns.scatterplot(
-        x=df1_xy[df_sign_resistant2].values.flatten(),
-        y=df2_xy[df_sign_resistant2].values.flatten(),
-        ax=ax,
-        plotnonfinite=False,
-        color="lightcoral",
-        lw=2,
-        s=5,
-    )
-    # drug1-drug2 shared resistance mutations
-    shared_resistant_1 = df1_xy.where(df_sign_resistant1 & df_sign_resistant2)
-    shared_resistant_2 = df2_xy.where(df_sign_resistant1 & df_sign_resistant2)
-    sns.scatterplot(
-        x=shared_resistant_1.values.flatten(),
-        y=shared_resistant_2.values.flatten(),
-        ax=ax,
-        plotnonfinite=False,
-        color="firebrick",
-        lw=2,
-        s=5,
-        marker="D",
-    )
+    # all mutations, binned over the visible range so cells of a grid match
+    if background == "hexbin":
+        ax.hexbin(
+            values1[finite],
+            values2[finite],
+            gridsize=50,
+            extent=(*xlim, *ylim),
+            cmap="Greys",
+            mincnt=1,
+            zorder=-1,
+            rasterized=True,
+        )
+    else:
+        ax.scatter(
+            values1[finite], values2[finite], color="gray", zorder=-1, **scatter_kws
+        )
+    # sensitive then resistance mutations, each as one collection for either
+    # drug followed by the drug1-drug2 shared mutations (diamonds) on top
+    for either, shared, color, shared_color in (
+        (sensitive, shared_sensitive, "dodgerblue", "mediumblue"),
+        (resistant, shared_resistant, "lightcoral", "firebrick"),
+    ):
+        either = finite & either
+        shared = finite & shared
+        ax.scatter(values1[either], values2[either], color=color, **scatter_kws)
+        ax.scatter(
+            values1[shared],
+            values2[shared],
+            color=shared_color,
+            marker="D",
+            **scatter_kws,
+        )
 
     ax.plot([-4, 4], [-4, 4], ":", color="gray", alpha=0.5, zorder=0)
     ax.plot([0, 0], [-4, 4], "-", color="gray", alpha=0.5, lw=1, zorder=0)
@@ -1328,10 +1693,76 @@ def drug_pairs_draw(
     data: SequencingData,
     read_threshold: int = 20,
     sigma_cutoff: int = 4,
-):
+    n_jobs: int = None,
+    background: str = "scatter",
+) -> matplotlib.figure:
+    """
+    Draw a triangular grid of drug pair scatter plots comparing the mean
+    fitness values of every pair of drugs in dataset
+
+    Parameters
+    ----------
+    data : SequencingData
+        Data from experiment sequencing with count-, enrichment-, and fitness-values
+    read_threshold : int, optional
+        Minimum number of reads required to be included, by default 20
+    sigma_cutoff : int, optional
+        How many sigmas away from the synonymous mutation values to use as the
+        cutoff for significance, by default 4
+    n_jobs : int, optional
+        Number of worker processes to find the significant mutations of each
+        drug with, negative values use all CPUs, by default None (serial)
+    background : str, optional
+        How to draw the layer of all mutations, either "scatter" or "hexbin",
+        see `drug_pair`, by default "scatter"
+
+    Returns
+    -------
+    fig : matplotlib.figure
+    """
+    if n_jobs == 0:
+        raise ValueError(
+            "n_jobs must be a positive number of processes, or negative for all CPUs"
+        )
     drugs_all = sorted([drug for drug in data.treatments if "UT" not in drug])
     rows = cols = len(drugs_all) - 1
-    fig, axs = plt.subplots(
+    # * find significance once per drug instead of per pair
+    significance = {}
+    if n_jobs is not None and n_jobs != 1:
+        # * fit the drugs not yet cached in worker processes, drawing stays here
+        keys = {
+            drug: _significance_key(drug, data, read_threshold, sigma_cutoff, None)
+            for drug in drugs_all
+        }
+        missing = [drug for drug in drugs_all if keys[drug] not in _significance_cache]
+        dfs_filtered = filter_fitness_read_noise(
+            data.counts, data.fitness, read_threshold=read_threshold
+        )
+        wt_mask = heatmap_masks(data.gene)
+        replicates = [
+            _drug_replicates(drug, data, dfs_filtered, wt_mask) for drug in missing
+        ]
+        # max_workers=None uses every CPU
+        max_workers = None if n_jobs < 0 else n_jobs
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                _significance, *zip(*replicates), [sigma_cutoff] * len(missing)
+            )
+            for drug, drug_result in zip(missing, results):
+                _store_significance(keys[drug], data, drug_result)
+                # keep the results here too, the bounded cache may evict them
+                significance[drug] = drug_result
+    for drug in drugs_all:
+        if drug not in significance:
+            significance[drug] = _drug_significance(
+                drug,
+                data,
+                read_threshold=read_threshold,
+                sigma_cutoff=sigma_cutoff,
+            )
+    stats = {drug: drug_stats(significance[drug]) for drug in drugs_all}
+    fig, axs = _subplots(
+        "drug_pairs_draw",
         rows,
         cols,
         figsize=(15, 15),
@@ -1352,6 +1783,9 @@ def drug_pairs_draw(
                     ax=ax,
                     read_threshold=read_threshold,
                     sigma_cutoff=sigma_cutoff,
+                    stats1=stats[drug_x],
+                    stats2=stats[drug_y],
+                    background=background,
                 )
                 if ax_col == 0:
                     ax.set_ylabel(drug_y)
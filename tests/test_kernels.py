@@ -0,0 +1,82 @@
+"""
+Checks that the NumPy fallbacks in `_kernels` give the same results as the
+numba kernels (and as a plain NumPy reference when numba isn't installed)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import _kernels  # pylint: disable=wrong-import-position
+
+
+def _random_masks(rows, cols, density, seed):
+    rng = np.random.default_rng(seed)
+    sensitive = rng.random((rows, cols)) < density
+    resistant = rng.random((rows, cols)) < density
+    return sensitive, resistant
+
+
+def _reference(sensitive, resistant, stop_col):
+    keep = np.ones(sensitive.shape[1], dtype=bool)
+    keep[stop_col] = False
+    return ((sensitive | resistant) & keep).any(axis=1)
+
+
+# column counts below, at and across the 8-bit and 64-bit lane boundaries
+@pytest.mark.parametrize("cols", [1, 7, 8, 9, 22, 24, 63, 64, 65, 130])
+@pytest.mark.parametrize("density", [0.0, 0.02, 0.5])
+@pytest.mark.parametrize("stop_col", [0, -1])
+def test_positions_with_signal_fallback(monkeypatch, cols, density, stop_col):
+    sensitive, resistant = _random_masks(287, cols, density, seed=cols)
+    stop_col = stop_col % cols
+    # rows whose only signal is in the stop column must not count
+    sensitive[:5] = False
+    resistant[:5] = False
+    sensitive[:5, stop_col] = True
+    expected = _reference(sensitive, resistant, stop_col)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(_kernels, "njit", None)
+        fallback = _kernels.positions_with_signal(sensitive, resistant, stop_col)
+    np.testing.assert_array_equal(fallback, expected)
+
+    if _kernels.njit is not None:
+        compiled = _kernels.positions_with_signal(sensitive, resistant, stop_col)
+        np.testing.assert_array_equal(compiled, fallback)
+
+
+def test_pack_rows_round_trip():
+    mask, _ = _random_masks(10, 70, 0.3, seed=0)
+    packed = _kernels._pack_rows(mask)  # pylint: disable=protected-access
+    assert packed.dtype == np.uint64
+    assert packed.shape == (10, 2)
+    unpacked = np.unpackbits(
+        packed.view(np.uint8), axis=-1, count=mask.shape[1], bitorder="little"
+    )
+    np.testing.assert_array_equal(unpacked.astype(bool), mask)
+
+
+@pytest.mark.parametrize("size", [0, 1, 50, 6888])
+def test_pair_finite_fallback(monkeypatch, size):
+    rng = np.random.default_rng(size)
+    x = rng.normal(size=size)
+    y = rng.normal(size=size)
+    x[rng.random(size) < 0.2] = np.nan
+    y[rng.random(size) < 0.2] = np.inf
+    finite = np.isfinite(x) & np.isfinite(y)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(_kernels, "njit", None)
+        x_fallback, y_fallback = _kernels.pair_finite(x, y)
+    np.testing.assert_array_equal(x_fallback, x[finite].astype(np.float32))
+    np.testing.assert_array_equal(y_fallback, y[finite].astype(np.float32))
+
+    if _kernels.njit is not None:
+        x_compiled, y_compiled = _kernels.pair_finite(x, y)
+        np.testing.assert_array_equal(x_compiled, x_fallback)
+        np.testing.assert_array_equal(y_compiled, y_fallback)